@@ -4,13 +4,9 @@ import plotly.express as px
 import pandas as pd
 import numpy as np
 from io import BytesIO
-import matplotlib.pyplot as plt
-from matplotlib.colors import LinearSegmentedColormap
+import copy
 import os
 
-# 设置中文字体
-plt.rcParams["font.family"] = ["SimHei", "WenQuanYi Micro Hei", "Heiti TC"]
-
 # 设置页面配置
 st.set_page_config(
     page_title="全球南方国家GDP占比分析",
@@ -46,11 +42,6 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# 自定义颜色映射
-color_map = LinearSegmentedColormap.from_list(
-    "custom_cmap", ["#2E8B57", "#4CAF50", "#81C784", "#A5D6A7"]
-)
-
 # 标题和说明
 st.markdown("""
 <div style="text-align: center; margin-bottom: 2rem;">
@@ -71,6 +62,26 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# 必要的数据列及其类型（显式schema省去pandas的类型推断扫描，
+# usecols同时把DataFrame裁剪到实际用到的列）
+required_columns = (
+    "年份",
+    "全球南方国家GDP占比(%)",
+    "亚洲贡献(%)",
+    "非洲贡献(%)",
+    "拉丁美洲贡献(%)",
+    "大洋洲贡献(%)"
+)
+
+column_dtypes = {
+    "年份": "int32",
+    "全球南方国家GDP占比(%)": "float32",
+    "亚洲贡献(%)": "float32",
+    "非洲贡献(%)": "float32",
+    "拉丁美洲贡献(%)": "float32",
+    "大洋洲贡献(%)": "float32",
+}
+
 # 从本地CSV文件读取数据
 @st.cache_data
 def load_data(file_path):
@@ -83,8 +94,20 @@ def load_data(file_path):
         if not os.access(file_path, os.R_OK):
             raise PermissionError(f"没有读取权限: {file_path}")
         
-        # 读取CSV文件
-        df = pd.read_csv(file_path)
+        # 读取CSV文件（优先PyArrow引擎，未安装时退回C引擎）
+        try:
+            df = pd.read_csv(
+                file_path,
+                engine="pyarrow",
+                usecols=required_columns,
+                dtype=column_dtypes,
+            )
+        except ImportError:
+            df = pd.read_csv(
+                file_path,
+                usecols=required_columns,
+                dtype=column_dtypes,
+            )
         
         # 检查数据是否为空
         if df.empty:
@@ -109,6 +132,75 @@ def load_data(file_path):
         st.error(f"加载数据时出错: {str(e)}")
         return None
 
+# 缓存主图动画帧的构建：只依赖年份/占比数组，
+# 调整动画速度等控件触发的重跑不会重新生成N个帧
+@st.cache_data
+def build_frames(years, vals):
+    # 完整曲线放在基础轨迹里，每帧只移动游标轨迹（traces=[1]）上的
+    # 一个点：发给浏览器的payload从O(N²)的前缀数组降到O(N)。
+    # 游标必须是SVG scatter：plotly.js的无重绘帧动画不支持scattergl
+    return [
+        dict(
+            data=[dict(type="scatter", x=[years[i]], y=[vals[i]])],
+            traces=[1],
+            name=str(years[i])
+        )
+        for i in range(len(years))
+    ]
+
+# 缓存区域数据的melt结果，避免每次重跑都重新melt
+@st.cache_data
+def melt_regions(df, region_columns):
+    df_melted = pd.melt(
+        df,
+        id_vars=["年份"],
+        value_vars=list(region_columns),
+        var_name="区域",
+        value_name="贡献(%)"
+    )
+    # 替换区域名称（单次向量化改写，代替逐区域布尔掩码赋值）
+    df_melted["区域"] = df_melted["区域"].str.removesuffix("贡献(%)")
+    return df_melted
+
+# 缓存按年份索引的视图：饼图滑块按年取数时走O(1)哈希索引，
+# 不再每次重跑做整列布尔掩码扫描
+@st.cache_data
+def index_by_year(df):
+    return df.set_index("年份", drop=False)
+
+# 缓存摘要/洞察数值：起止年份占比和贡献最大的区域只算一次，
+# 不在每次重跑的f-string里重复做整列求和与标签索引
+@st.cache_data
+def compute_insights(df, region_columns):
+    year_idx = df.columns.get_loc("年份")
+    pct_idx = df.columns.get_loc("全球南方国家GDP占比(%)")
+    return {
+        "start_year": int(df.iat[0, year_idx]),
+        "end_year": int(df.iat[-1, year_idx]),
+        "start_pct": float(df.iat[0, pct_idx]),
+        "end_pct": float(df.iat[-1, pct_idx]),
+        "top_region": df[list(region_columns)].sum().idxmax().removesuffix("贡献(%)"),
+    }
+
+# 缓存下载用的导出数据：每个数据版本只生成一次，
+# 普通重跑（滑块、筛选）不再重复执行to_csv/to_excel
+@st.cache_data
+def make_csv(df):
+    return df.to_csv(index=False, encoding="utf-8-sig").encode("utf-8-sig")
+
+@st.cache_data
+def make_xlsx(df):
+    # strings_to_urls跳过逐格URL检测；注意不能开constant_memory：
+    # pandas按列写出，流式模式会丢弃已刷出行的写入
+    with BytesIO() as buf:
+        with pd.ExcelWriter(
+            buf,
+            engine="xlsxwriter",
+            engine_kwargs={"options": {"strings_to_urls": False}},
+        ) as writer:
+            df.to_excel(writer, index=False)
+        return buf.getvalue()
+
 # 获取当前工作目录
 current_dir = os.getcwd()
 
@@ -127,39 +219,34 @@ if df is None:
     st.error("无法继续执行：数据加载失败。请检查CSV文件路径和格式。")
     st.stop()
 
-# 检查数据是否包含必要的列
-required_columns = [
-    "年份", 
-    "全球南方国家GDP占比(%)", 
-    "亚洲贡献(%)", 
-    "非洲贡献(%)", 
-    "拉丁美洲贡献(%)", 
-    "大洋洲贡献(%)"
-]
-
 # 验证所有必要列都存在
-missing_columns = [col for col in required_columns if col not in df.columns]
+column_set = set(df.columns)
+missing_columns = [col for col in required_columns if col not in column_set]
 if missing_columns:
     st.error(f"CSV文件缺少必要的列: {', '.join(missing_columns)}")
     st.error("请确保CSV文件包含以下列: " + ", ".join(required_columns))
     st.stop()
 
-# 检查必要列是否有缺失值
-for col in required_columns:
-    if df[col].isnull().any():
-        st.warning(f"列 '{col}' 包含缺失值，可能影响分析结果")
+# 检查必要列是否有缺失值（单次融合扫描，代替逐列isnull遍历）
+null_mask = df[list(required_columns)].isna().any()
+for col in null_mask[null_mask].index:
+    st.warning(f"列 '{col}' 包含缺失值，可能影响分析结果")
 
-# 添加颜色列（如果不存在）
-region_colors = {
+# 各区域的显示颜色（查找表，不再作为常量列存进DataFrame）
+REGION_COLORS = {
     "亚洲": "#32CD32",  # 绿色
     "非洲": "#FFA500",  # 橙色
     "拉丁美洲": "#FF6347",  # 红色
     "大洋洲": "#1E90FF"   # 蓝色
 }
 
-for region, color in region_colors.items():
-    if f"{region}颜色" not in df.columns:
-        df[f"{region}颜色"] = color
+# 区域列表及各区域对应的贡献列名（预先构建，
+# 避免每次重跑/每帧重复拼接同样的f-string键）
+regions = list(REGION_COLORS)
+CONTRIB_COL = {region: f"{region}贡献(%)" for region in regions}
+
+# 摘要卡片和关键洞察共用的预计算数值
+insights = compute_insights(df, tuple(CONTRIB_COL.values()))
 
 # 侧边栏 - 筛选和交互控件
 with st.sidebar:
@@ -167,7 +254,6 @@ with st.sidebar:
     
     # 区域筛选
     st.markdown('### <i class="fa fa-map-o"></i> 选择区域', unsafe_allow_html=True)
-    regions = ["亚洲", "非洲", "拉丁美洲", "大洋洲"]
     selected_regions = st.multiselect(
         "显示区域",
         regions,
@@ -216,18 +302,34 @@ with col1:
     fig = go.Figure()
     
     # 添加初始数据
+    # Scattergl走WebGL渲染，点数增多时不会像SVG那样逐点生成DOM节点；
+    # GL不支持shape="spline"，曲线退回直线段
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=df["年份"],
             y=df["全球南方国家GDP占比(%)"],
             mode="lines+markers",
-            line=dict(color="#2E8B57", width=4, shape="spline"),
+            line=dict(color="#2E8B57", width=4),
             marker=dict(size=10, color="#1F6E46", symbol="circle"),
             name="全球南方国家GDP占比(%)",
             hovertemplate="年份: %{x}<br>占比: %{y:.2f}%<extra></extra>"
         )
     )
-    
+
+    # 游标轨迹：动画帧只更新这个单点，完整曲线保持不动。
+    # 保持SVG scatter——单点用WebGL没有收益，而且redraw=False的
+    # 帧动画在plotly.js里只对SVG轨迹生效
+    fig.add_trace(
+        go.Scatter(
+            x=[df["年份"].iloc[0]],
+            y=[df["全球南方国家GDP占比(%)"].iloc[0]],
+            mode="markers",
+            marker=dict(size=16, color="#1F6E46", symbol="circle"),
+            hoverinfo="skip",
+            showlegend=False,
+        )
+    )
+
     # 添加目标线
     min_value = df["全球南方国家GDP占比(%)"].min()
     max_value = df["全球南方国家GDP占比(%)"].max()
@@ -247,24 +349,12 @@ with col1:
         annotation_font=dict(color="#4682B4")
     )
     
-    # 创建动画帧
-    frames = []
-    for year in df["年份"].unique():
-        year_data = df[df["年份"] <= year]
-        frames.append(
-            go.Frame(
-                data=[
-                    go.Scatter(
-                        x=year_data["年份"],
-                        y=year_data["全球南方国家GDP占比(%)"],
-                        mode="lines+markers",
-                        line=dict(color="#2E8B57", width=4, shape="spline"),
-                        marker=dict(size=10, color="#1F6E46", symbol="circle"),
-                    )
-                ],
-                name=str(year)
-            )
-        )
+    # 创建动画帧（缓存：速度滑块变化时不重建）
+    # 年份已按时间排序，直接用NumPy前缀切片代替逐年布尔过滤，
+    # 避免每帧重新扫描和复制整个DataFrame
+    years_np = df["年份"].to_numpy()
+    vals_np = df["全球南方国家GDP占比(%)"].to_numpy()
+    frames = build_frames(years_np, vals_np)
     
     # 更新图表布局
     fig.update_layout(
@@ -279,13 +369,16 @@ with col1:
         font=dict(family="sans-serif", size=12, color="#333333"),
         showlegend=False,
         # 设置动画参数
+        # redraw=False：每帧只做增量restyle，不整图relayout。
+        # 这里动画只更新x/y，保持False；若将来有帧需要改坐标轴/
+        # 类目等非过渡属性，才需要改回True
         updatemenus=[{
             "type": "buttons",
             "buttons": [{
                 "label": "播放",
                 "method": "animate",
                 "args": [None, {
-                    "frame": {"duration": animation_speed, "redraw": True},
+                    "frame": {"duration": animation_speed, "redraw": False},
                     "fromcurrent": True,
                     "transition": {"duration": 300, "easing": "quadratic-in-out"}
                 }]
@@ -293,7 +386,7 @@ with col1:
                 "label": "暂停",
                 "method": "animate",
                 "args": [[None], {
-                    "frame": {"duration": 0, "redraw": True},
+                    "frame": {"duration": 0, "redraw": False},
                     "mode": "immediate",
                     "transition": {"duration": 0}
                 }]
@@ -308,12 +401,12 @@ with col1:
         sliders=[{
             "active": 0,
             "steps": [{
-                "args": [[f.name], {
-                    "frame": {"duration": animation_speed, "redraw": True},
+                "args": [[f["name"]], {
+                    "frame": {"duration": animation_speed, "redraw": False},
                     "mode": "immediate",
                     "transition": {"duration": 300}
                 }],
-                "label": f.name,
+                "label": f["name"],
                 "method": "animate"
             } for f in frames],
             "x": 0.1,
@@ -335,7 +428,8 @@ with col1:
     fig.frames = frames
     
     # 设置初始视图范围
-    fig.update_xaxes(range=[df["年份"].min(), df["年份"].max()])
+    # 年份已排序，首末元素即范围，无需整列min/max归约
+    fig.update_xaxes(range=[years_np[0], years_np[-1]])
     fig.update_yaxes(range=[max(0, min_value-5), min(100, max_value+5)])
     
     # 自动播放动画
@@ -366,11 +460,11 @@ with col1:
         st.write("尝试使用静态图表替代:")
         static_fig = go.Figure()
         static_fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=df["年份"],
                 y=df["全球南方国家GDP占比(%)"],
                 mode="lines+markers",
-                line=dict(color="#2E8B57", width=4, shape="spline"),
+                line=dict(color="#2E8B57", width=4),
                 marker=dict(size=10, color="#1F6E46", symbol="circle"),
                 hovertemplate="年份: %{x}<br>占比: %{y:.2f}%<extra></extra>"
             )
@@ -406,9 +500,9 @@ with col1:
     with col1_sum:
         st.markdown(f"""
         <div class="stat-card" style="background-color: #e8f5e9; border-radius: 8px; padding: 1rem; text-align: center;">
-            <p class="stat-title" style="color: #666; font-size: 0.9rem;">起始占比 ({df["年份"].min()}年)</p>
+            <p class="stat-title" style="color: #666; font-size: 0.9rem;">起始占比 ({insights['start_year']}年)</p>
             <p class="stat-value" style="color: #2E8B57; font-size: 1.5rem; font-weight: bold;">
-                {df.iloc[0]["全球南方国家GDP占比(%)"]:.2f}%
+                {insights['start_pct']:.2f}%
             </p>
         </div>
         """, unsafe_allow_html=True)
@@ -416,9 +510,9 @@ with col1:
     with col2_sum:
         st.markdown(f"""
         <div class="stat-card" style="background-color: #e8f5e9; border-radius: 8px; padding: 1rem; text-align: center;">
-            <p class="stat-title" style="color: #666; font-size: 0.9rem;">当前占比 ({df["年份"].max()}年)</p>
+            <p class="stat-title" style="color: #666; font-size: 0.9rem;">当前占比 ({insights['end_year']}年)</p>
             <p class="stat-value" style="color: #2E8B57; font-size: 1.5rem; font-weight: bold;">
-                {df.iloc[-1]["全球南方国家GDP占比(%)"]:.2f}%
+                {insights['end_pct']:.2f}%
             </p>
         </div>
         """, unsafe_allow_html=True)
@@ -431,108 +525,114 @@ with col2:
     """, unsafe_allow_html=True)
     
     # 创建区域贡献动画图表
-    region_columns = [f"{region}贡献(%)" for region in selected_regions]
+    region_columns = [CONTRIB_COL[region] for region in selected_regions]
     region_names = selected_regions
-    region_colors = [df[f"{region}颜色"].iloc[0] for region in selected_regions]
-    
-    # 准备数据用于动画
-    df_melted = pd.melt(
-        df,
-        id_vars=["年份"],
-        value_vars=region_columns,
-        var_name="区域",
-        value_name="贡献(%)"
-    )
+    region_colors_list = [REGION_COLORS[region] for region in selected_regions]
     
-    # 替换区域名称
-    for region in regions:
-        df_melted.loc[df_melted["区域"] == f"{region}贡献(%)", "区域"] = region
-    
-    # 创建动画条形图
-    fig_regions = px.bar(
-        df_melted,
-        x="区域",
-        y="贡献(%)",
-        color="区域",
-        color_discrete_sequence=region_colors,
-        animation_frame="年份",
-        range_y=[0, df[region_columns].max().max() * 1.1],
-        template="plotly_white"
-    )
-    
-    # 更新布局
-    fig_regions.update_layout(
-        xaxis_title="",
-        yaxis_title="贡献比例(%)",
-        hovermode="x unified",
-        height=500,
-        margin=dict(l=40, r=20, t=40, b=60),
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(family="sans-serif", size=12, color="#333333"),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1,
-            bgcolor="rgba(255,255,255,0.7)",
-            bordercolor="rgba(255,255,255,0)"
-        ),
-        updatemenus=[{
-            "type": "buttons",
-            "buttons": [{
-                "label": "播放",
-                "method": "animate",
-                "args": [None, {
-                    "frame": {"duration": animation_speed, "redraw": True},
-                    "fromcurrent": True,
-                    "transition": {"duration": 300, "easing": "quadratic-in-out"}
-                }]
-            }, {
-                "label": "暂停",
-                "method": "animate",
-                "args": [[None], {
-                    "frame": {"duration": 0, "redraw": True},
-                    "mode": "immediate",
-                    "transition": {"duration": 0}
-                }]
-            }],
-            "direction": "left",
-            "pad": {"r": 10, "t": 85},
-            "x": 0.1,
-            "y": 0,
-            "xanchor": "right",
-            "yanchor": "top"
-        }],
-        sliders=[{
-            "active": 0,
-            "steps": [{
-                "args": [[f.name], {
-                    "frame": {"duration": animation_speed, "redraw": True},
-                    "mode": "immediate",
-                    "transition": {"duration": 300}
+    # 条形图动画整体缓存在session_state中（按所选区域区分）：
+    # 只改动画速度时跳过整个px.bar帧构建管线，仅补丁播放时长
+    regions_fig_key = ("regions_fig", tuple(selected_regions))
+    if regions_fig_key not in st.session_state:
+        # 准备数据用于动画（缓存：仅在所选区域变化时重新melt）
+        df_melted = melt_regions(df, tuple(region_columns))
+
+        # 创建动画条形图
+        fig_regions = px.bar(
+            df_melted,
+            x="区域",
+            y="贡献(%)",
+            color="区域",
+            color_discrete_sequence=region_colors_list,
+            animation_frame="年份",
+            range_y=[0, df[region_columns].max().max() * 1.1],
+            template="plotly_white"
+        )
+
+        # 更新布局（播放时长在下方按当前速度补丁，这里只是占位值）
+        fig_regions.update_layout(
+            xaxis_title="",
+            yaxis_title="贡献比例(%)",
+            hovermode="x unified",
+            height=500,
+            margin=dict(l=40, r=20, t=40, b=60),
+            plot_bgcolor="rgba(0,0,0,0)",
+            paper_bgcolor="rgba(0,0,0,0)",
+            font=dict(family="sans-serif", size=12, color="#333333"),
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=1.02,
+                xanchor="right",
+                x=1,
+                bgcolor="rgba(255,255,255,0.7)",
+                bordercolor="rgba(255,255,255,0)"
+            ),
+            updatemenus=[{
+                "type": "buttons",
+                "buttons": [{
+                    "label": "播放",
+                    "method": "animate",
+                    "args": [None, {
+                        "frame": {"duration": animation_speed, "redraw": False},
+                        "fromcurrent": True,
+                        "transition": {"duration": 300, "easing": "quadratic-in-out"}
+                    }]
+                }, {
+                    "label": "暂停",
+                    "method": "animate",
+                    "args": [[None], {
+                        "frame": {"duration": 0, "redraw": False},
+                        "mode": "immediate",
+                        "transition": {"duration": 0}
+                    }]
                 }],
-                "label": f.name,
-                "method": "animate"
-            } for f in fig_regions.frames],
-            "x": 0.1,
-            "len": 0.9,
-            "xanchor": "left",
-            "yanchor": "top",
-            "pad": {"t": 100, "b": 10},
-            "currentvalue": {
-                "visible": True,
-                "prefix": "年份: ",
+                "direction": "left",
+                "pad": {"r": 10, "t": 85},
+                "x": 0.1,
+                "y": 0,
                 "xanchor": "right",
-                "font": {"size": 14, "color": "#2E8B57"}
-            },
-            "transition": {"duration": 300, "easing": "cubic-in-out"}
-        }]
-    )
-    
+                "yanchor": "top"
+            }],
+            sliders=[{
+                "active": 0,
+                "steps": [{
+                    "args": [[f.name], {
+                        "frame": {"duration": animation_speed, "redraw": False},
+                        "mode": "immediate",
+                        "transition": {"duration": 300}
+                    }],
+                    "label": f.name,
+                    "method": "animate"
+                } for f in fig_regions.frames],
+                "x": 0.1,
+                "len": 0.9,
+                "xanchor": "left",
+                "yanchor": "top",
+                "pad": {"t": 100, "b": 10},
+                "currentvalue": {
+                    "visible": True,
+                    "prefix": "年份: ",
+                    "xanchor": "right",
+                    "font": {"size": 14, "color": "#2E8B57"}
+                },
+                "transition": {"duration": 300, "easing": "cubic-in-out"}
+            }]
+        )
+        st.session_state[regions_fig_key] = fig_regions.to_dict()
+
+    # 每次重跑只补丁动画速度相关的时长，不重建图表。
+    # 未选任何区域时to_dict()会剪掉空的steps/updatemenus，用get兜底
+    fig_regions_dict = copy.deepcopy(st.session_state[regions_fig_key])
+    for menu in fig_regions_dict["layout"].get("updatemenus", []):
+        for btn in menu.get("buttons", []):
+            if btn.get("label") == "播放":
+                btn["args"][1]["frame"]["duration"] = animation_speed
+    for slider in fig_regions_dict["layout"].get("sliders", []):
+        for step in slider.get("steps", []):
+            step["args"][1]["frame"]["duration"] = animation_speed
+
     # 显示图表
-    st.plotly_chart(fig_regions, use_container_width=True)
+    st.plotly_chart(fig_regions_dict, use_container_width=True)
     
     # 饼图显示当前年份各区域贡献比例
     st.markdown("""
@@ -544,24 +644,28 @@ with col2:
     # 添加年份选择器
     selected_year = st.slider(
         "选择年份查看各区域贡献占比",
-        min_value=int(df["年份"].min()),
-        max_value=int(df["年份"].max()),
-        value=int(df["年份"].max()),
+        min_value=insights["start_year"],
+        max_value=insights["end_year"],
+        value=insights["end_year"],
         step=1
     )
     
-    # 获取所选年份的数据
-    year_data = df[df["年份"] == selected_year]
-    
-    if not year_data.empty:
-        region_contributions = [year_data[f"{region}贡献(%)"].values[0] for region in selected_regions]
-        
+    # 获取所选年份的数据（索引查找代替布尔过滤）
+    df_indexed = index_by_year(df)
+    try:
+        row = df_indexed.loc[selected_year, region_columns]
+    except KeyError:
+        row = None
+
+    if row is not None:
+        region_contributions = row.values.tolist()
+
         # 创建饼图
         fig_pie = px.pie(
             values=region_contributions,
             names=selected_regions,
             color=selected_regions,
-            color_discrete_sequence=region_colors,
+            color_discrete_sequence=region_colors_list,
             title=f"{selected_year}年各区域贡献占比"
         )
         
@@ -585,11 +689,9 @@ st.markdown("""
     <div class="download-buttons" style="display: flex; gap: 1rem;">
 """, unsafe_allow_html=True)
 
-# 准备下载数据
-csv_data = df.to_csv(index=False, encoding="utf-8-sig")
-excel_data = BytesIO()
-df.to_excel(excel_data, index=False, engine="openpyxl")
-excel_data.seek(0)
+# 准备下载数据（缓存，仅在数据变化时重新生成）
+csv_data = make_csv(df)
+excel_data = make_xlsx(df)
 
 # 下载按钮
 col_download1, col_download2 = st.columns(2)
@@ -615,22 +717,25 @@ with col_download2:
 
 st.markdown("</div></div>", unsafe_allow_html=True)
 
-# 数据表格预览
+# 数据表格预览：默认只序列化前200行给浏览器，
+# 完整数据按需勾选（hide_index省去Arrow端的索引重建）
 with st.expander("查看详细数据"):
-    st.dataframe(df, use_container_width=True)
+    show_full_df = st.checkbox("显示完整数据", key="show_full_df")
+    preview_df = df if show_full_df else df.head(200)
+    st.dataframe(preview_df, use_container_width=True, hide_index=True)
 
-# 关键洞察
-st.markdown("""
+# 关键洞察（数值来自缓存的insights，避免每次重跑重新求和/索引）
+st.markdown(f"""
 <div class="insights-section" style="background-color: white; border-radius: 10px; padding: 1.5rem; margin-top: 2rem; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
     <h3 style="color: #2E8B57; font-size: 1.5rem; margin-bottom: 1rem;">关键洞察</h3>
     <div class="insight-cards" style="display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 1.5rem;">
         <div class="insight-card" style="background-color: #e8f5e9; border-radius: 8px; padding: 1.2rem; border-left: 4px solid #2E8B57;">
             <h4 style="color: #2E8B57; font-size: 1.2rem; margin-bottom: 0.5rem;">显著增长趋势</h4>
-            <p style="color: #666;">分析期间，全球南方国家GDP占比从{df.iloc[0]["全球南方国家GDP占比(%)"]:.2f}%增长至{df.iloc[-1]["全球南方国家GDP占比(%)"]:.2f}%，反映了全球经济力量格局的变化。</p>
+            <p style="color: #666;">分析期间，全球南方国家GDP占比从{insights['start_pct']:.2f}%增长至{insights['end_pct']:.2f}%，反映了全球经济力量格局的变化。</p>
         </div>
         <div class="insight-card" style="background-color: #e8f5e9; border-radius: 8px; padding: 1.2rem; border-left: 4px solid #2E8B57;">
             <h4 style="color: #2E8B57; font-size: 1.2rem; margin-bottom: 0.5rem;">区域贡献差异</h4>
-            <p style="color: #666;">{df[region_columns].sum(axis=0).idxmax().replace('贡献(%)', '')}贡献最大，成为全球南方经济增长的主要推动力。其他区域也呈现稳步增长趋势。</p>
+            <p style="color: #666;">{insights['top_region']}贡献最大，成为全球南方经济增长的主要推动力。其他区域也呈现稳步增长趋势。</p>
         </div>
         <div class="insight-card" style="background-color: #e8f5e9; border-radius: 8px; padding: 1.2rem; border-left: 4px solid #2E8B57;">
             <h4 style="color: #2E8B57; font-size: 1.2rem; margin-bottom: 0.5rem;">趋势预测</h4>